@@ -12,9 +12,33 @@
     :license: MIT, see LICENSE for more details.
 """
 
+from array import array
+
 from .tree import Tree, Edge
 
 
+def _match_len(text, i, j, limit):
+    """Return length of the longest common prefix of `text[i:]` and `text[j:]`
+    which is not longer than `limit`.
+
+    The runs of characters are compared at once by galloping: the run length is
+    doubled on each match and halved on each mismatch.
+    """
+    length = 0
+    step = 1
+    while length < limit:
+        step = min(step, limit - length)
+        if text.startswith(text[j+length:j+length+step], i + length):
+            length += step
+            step *= 2
+        elif step == 1:
+            break
+        else:
+            step //= 2
+
+    return length
+
+
 class SuffixEdge(Edge):
     """An edge in the suffix tree.
 
@@ -28,7 +52,9 @@ class SuffixEdge(Edge):
         property of the `dst` subtrees, since SuffixTree class implements
         this property to refer to the corresponding string.
     """
-    def __init__(self, start, end, **edge_options):
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start, end, dst, src=None):
         """Constructor for SuffixEdge class.
 
         Args:
@@ -36,31 +62,29 @@ class SuffixEdge(Edge):
                 this edge.
             end (int) [required]: End index of the string represented by this
                 edge.
-            edge_options (dict): Other parameters which will be passed to super
-                class (Edge); e.g. `dst` and `src`. See `Edge.__init__()` for
-                more information.
+            dst (SuffixTree) [required]: The subtree to which this edge goes.
+            src (SuffixTree): The subtree that this edge comes from (optional).
+                See `Edge.__init__()` for more information.
         """
-        super().__init__(data=(start, end), **edge_options)
-
-    @property
-    def start(self):
-        """Return start index of the string represented by this edge."""
-        return self.data[0]
-
-    @start.setter
-    def start(self, _start):
-        """Set 'start' attribute."""
-        self.data = (_start, self.data[1])
+        # pylint: disable=super-init-not-called
+        # Edges are created O(n) times during the construction; so the slots
+        # ...are set directly rather than through `Edge.__init__` and `data`
+        # ...setter which pack and unpack the pair. `start` and `end` are plain
+        # ...attributes, so updating one of them does not rebuild the pair.
+        self.dst = dst
+        self.src = src
+        self.start = start
+        self.end = end
 
     @property
-    def end(self):
-        """Return end index of the string represented by this edge."""
-        return self.data[1]
+    def data(self):
+        """Return the pair of start and end index as the edge data."""
+        return (self.start, self.end)
 
-    @end.setter
-    def end(self, _end):
-        """Set 'end' attribute."""
-        self.data = (self.data[0], _end)
+    @data.setter
+    def data(self, _data):
+        """Set 'start' and 'end' attributes from the given pair."""
+        self.start, self.end = _data
 
     @property
     def edge_char(self):
@@ -102,21 +126,14 @@ class Substr():
     corresponding node (tree). The triple (None, None, 0) is used for showing an
     invalid substring in this class.
     """
-    def __init__(self, subtree, string="", edge_char=None, depth=0):
+    __slots__ = ('_subtree', '_edge_char', '_depth', '_substr')
+
+    def __init__(self, subtree, edge_char=None, depth=0):
         """Constructor for Substr class.
 
         Args:
-            subtree (SuffixTree): A subtree in the suffix tree. From this node
-                we can reach to the desired subtree by consuming the `string`
-                (next parameter).
-            string (str): The string that should be consumed from the given
-                subtree to reach to the end of the desired substring. The triple
-                (tree, char, depth) described above will be computed such that
-                the subtree would be the deepest node in the tree that is
-                formally the longest prefix of the substring that ends on a
-                node. String can be anything, but it should be present in the
-                suffix tree. Otherwise, the state of class would be invalid:
-                (None, None, 0).
+            subtree (SuffixTree): A subtree in the suffix tree; i.e. initial
+                value of `_subtree` attribute (see below).
             edge_char (char): Initial value of `_edge_char` attribute (see
                 below).
             depth (int): Initial value of `_depth` attribute (see below).
@@ -128,13 +145,34 @@ class Substr():
         # Number of characters should be skipped to reach to the end of the
         # substring from the subtree's root node.
         self._depth = depth
-        # Compute the triple (t, c, d) so that t would be corresponding node of
-        # the longest prefix of the substring which ends on a node.
-        self.extend(string)
-        # The actual substring from the root node of the suffix tree which may
-        # be different from the provided `string`. It's computed on demand.
+        # The actual substring from the root node of the suffix tree. It's
+        # computed on demand.
         self._substr = None
 
+    @classmethod
+    def from_query(cls, subtree, query):
+        """Create the substring reached by consuming the `query` from the given
+        subtree.
+
+        Args:
+            subtree (SuffixTree): A subtree in the suffix tree. From this node
+                we can reach to the desired subtree by consuming the `query`.
+            query (str): The string that should be consumed from the given
+                subtree to reach to the end of the desired substring. The triple
+                (tree, char, depth) described above will be computed such that
+                the subtree would be the deepest node in the tree that is
+                formally the longest prefix of the substring that ends on a
+                node. Query can be anything, but it should be present in the
+                suffix tree. Otherwise, the state of class would be invalid:
+                (None, None, 0).
+
+        Return:
+            the new Substr instance.
+        """
+        substr = cls(subtree)
+        substr.extend(query)
+        return substr
+
     @property
     def subtree(self):
         """Read-only property returning `self._subtree`."""
@@ -150,6 +188,20 @@ class Substr():
         """Read-only property returning `self._depth`."""
         return self._depth
 
+    def reset(self, subtree, edge_char=None, depth=0):
+        """Set the substring to the given triple (t, c, d) in place. It allows
+        reusing the object instead of instantiating a new one.
+
+        Args:
+            subtree (SuffixTree): New value of `_subtree` attribute.
+            edge_char (char): New value of `_edge_char` attribute.
+            depth (int): New value of `_depth` attribute.
+        """
+        self._subtree = subtree
+        self._edge_char = edge_char
+        self._depth = depth
+        self._substr = None  # The old value is not valid anymore.
+
     def ends_on_node(self):
         """Retrun true if the substring ends on a node rather than on a edge.
         """
@@ -160,12 +212,14 @@ class Substr():
         character indicated by depth on the edge by 'edge_char' ID of the root
         of the specified subtree).
         """
-        edge_str = ""
-        if not self.ends_on_node():
-            edge = self._subtree.root_edges[self._edge_char]
-            edge_str = self._subtree.string[edge.start:edge.start+self._depth+1]
+        if self.ends_on_node():
+            return self._subtree.pathlabel
 
-        return self._subtree.pathlabel + edge_str
+        # The path label of the subtree ends right before its edges start (see
+        # ...`SuffixTree.get_pathlabel`), so the substring is sliced at once.
+        edge = self._subtree.root_edges[self._edge_char]
+        start = edge.start - self._subtree.pathlabel_len
+        return self._subtree.string[start:edge.start+self._depth]
 
     def extend(self, string, forced=True):
         """Extend the substring with the given string if the new substring is in
@@ -181,51 +235,119 @@ class Substr():
         Return:
             True if the string is found. Otherwise it returns False.
         """
-        old_subtree = self._subtree
-        old_edge_char = self._edge_char
-        old_depth = self._depth
-
+        # pylint: disable=protected-access
+        if not string:
+            return True  # Nothing to consume; the state remains as it is.
+
+        # The walk is done on local copies of the state which are stored back
+        # ...only at the end. So the last state is kept if it's rejected.
+        subtree = self._subtree
+        edge_char = self._edge_char
+        depth = self._depth
+
+        text = subtree.string
+        strlen = len(string)
         found = True  # We are optimistic!
-        while string:  # While string is not fully consumed...
-            if self.ends_on_node():
-                if string[0] not in self._subtree.root_edges:
+        # The string is walked edge by edge: `pos` is the position in `string`
+        # ...from which the current edge is compared.
+        pos = 0
+        while pos < strlen:  # While string is not fully consumed...
+            if depth == 0:
+                # A single lookup: missing edges are reported by None.
+                edge = subtree._root_edges.get(string[pos])
+                if edge is None:
                     found = False
                     break
-                self._edge_char = string[0]
-            edge = self._subtree.root_edges[self._edge_char]
-            # pivot = how many characters can be reads in the current state.
-            pivot = len(edge) - self._depth
-            # Pick a prefix from `string` as much as possible.
-            snippet, string = string[:pivot], string[pivot:]
-            if not str(edge)[self._depth:].startswith(snippet):
+                edge_char = string[pos]
+            else:
+                edge = subtree._root_edges[edge_char]
+            edge_len = edge.end - edge.start
+            # How many characters can be read in the current state.
+            step = min(edge_len - depth, strlen - pos)
+            # Compare in place against the text; no edge label is built.
+            if not text.startswith(string[pos:pos+step], edge.start + depth):
                 found = False
                 break
-            if len(snippet) == pivot:
-                self._subtree = edge.dst
-                self._edge_char = None
-                self._depth = 0
-            elif len(snippet) < pivot:
-                self._depth += len(snippet)
-                assert not string  # All of the string should be consumed here.
-            else:
-                # `len(snippet)` cannot be greater than `pivot`.
-                assert False
-
-        if not found:
-            if forced:
-                self._subtree = None
-                self._edge_char = None
-                self._depth = 0
-            else:
-                self._subtree = old_subtree
-                self._edge_char = old_edge_char
-                self._depth = old_depth
-
-        if found or forced:
-            self._substr = None  # The old value is not valid anymore.
+            pos += step
+            depth += step
+            if depth == edge_len:
+                subtree = edge.dst
+                edge_char = None
+                depth = 0
+
+        if found:
+            self.reset(subtree, edge_char, depth)
+        elif forced:
+            self.reset(None)
 
         return found
 
+    def extend_char(self, char, text):
+        """Extend the substring with a single character. It is the specialised
+        version of `extend(char, forced=False)` for the construction loop: if
+        the new substring is not in the tree, it returns False and the state
+        remains as it is.
+
+        Args:
+            char (char): Extension character.
+            text (str): The string of the suffix tree.
+
+        Return:
+            True if the new substring is found. Otherwise it returns False.
+        """
+        # pylint: disable=protected-access
+        if self._depth == 0:
+            edge = self._subtree._root_edges.get(char)
+            if edge is None:
+                return False
+            self._edge_char = char
+        else:
+            edge = self._subtree._root_edges[self._edge_char]
+            if text[edge.start + self._depth] != char:
+                return False
+
+        self._depth += 1
+        if self._depth == edge.end - edge.start:
+            self._subtree = edge.dst
+            self._edge_char = None
+            self._depth = 0
+        self._substr = None  # The old value is not valid anymore.
+
+        return True
+
+    def extend_along_edge(self, text, pos):
+        """Extend the substring along the edge on which it ends by the longest
+        prefix of `text[pos:]` that matches the rest of the edge. Characters are
+        compared in runs rather than one by one. Nothing happens if the
+        substring ends on a node.
+
+        Args:
+            text (str): The string of the suffix tree.
+            pos (int): Position in `text` from which the extension starts.
+
+        Return:
+            number of consumed characters.
+        """
+        # pylint: disable=protected-access
+        if self.ends_on_node():
+            return 0
+
+        edge = self._subtree._root_edges[self._edge_char]
+        edge_len = edge.end - edge.start
+        limit = min(edge_len - self._depth, len(text) - pos)
+        length = _match_len(text, edge.start + self._depth, pos, limit)
+        if not length:
+            return 0
+
+        self._depth += length
+        if self._depth == edge_len:
+            self._subtree = edge.dst
+            self._edge_char = None
+            self._depth = 0
+        self._substr = None  # The old value is not valid anymore.
+
+        return length
+
     def __bool__(self):
         """Does `self` represent a valid substring?"""
         return self._subtree is not None
@@ -244,17 +366,20 @@ class Substr():
                            str(self._depth))
 
 
-class SuffixTree(Tree):
+class SuffixTree(Tree):  # pylint: disable=too-many-instance-attributes
     """Suffix tree class.
 
     Implements a compressed trie containing all suffixes of the given string. it
     can be used as an index of the given text for fast string operations.
     """
+    __slots__ = ('_abstract', '_pathlabel_len', '_case_sensitive', '_string',
+                 'suffix_link', '_active', '_suffix_array', '_sa_lo', '_sa_hi')
+
     # Sentinel character. It will be concatenated at the end of the text.
     sentinel = "$"
 
     def __init__(self, string, case_sensitive=False, suffix_link=None,
-                 **tree_options):
+                 pathlabel_len=0, **tree_options):
         """Constructor for SuffixTree class.
 
         Args:
@@ -273,6 +398,9 @@ class SuffixTree(Tree):
             suffix_link (SuffixTree): In non-root nodes, it relates current node
                 to its suffix node; e.g. this is a sample suffix path in the
                 tree: 'abc' -> 'bc' -> 'c'. In root nodes, it's set to be None.
+            pathlabel_len (int): In non-root nodes, length of the substring
+                represented by the node (see `pathlabel`). It is zero for root
+                nodes.
             tree_options (dict): The tree parameters required for Tree class
                 initialization. It will be directly passed to the super class
                 `__init__` function.
@@ -295,8 +423,12 @@ class SuffixTree(Tree):
         if string is None:
             self._abstract = True
 
-        # The substring represented by this node (by tree-as-a-node perspective)
-        self._pathlabel = None
+        # Length of the substring represented by this node (by tree-as-a-node
+        # perspective). The substring itself is computed on demand.
+        self._pathlabel_len = pathlabel_len
+        # Interval of the suffix array covering this subtree. It's stamped by
+        # ...`_index_suffixes`; so it's empty for nodes that are not indexed.
+        self._sa_lo = self._sa_hi = 0
 
         if not self._abstract:
             # Processing the string...
@@ -310,9 +442,18 @@ class SuffixTree(Tree):
             self.suffix_link = None
             # Initializing internal variable for construction.
             self._active = None
+            # Suffix array of the text in DFS order of the tree. It is shared
+            # ...by all nodes and filled in after the construction.
+            self._suffix_array = array('l')
             # Construct the suffix tree!
             self._construct()
+            self._index_suffixes()
         else:
+            # They are set from the root node when the node is created by the
+            # ...suffix tree, or fetched once on the first access otherwise.
+            self._case_sensitive = None
+            self._string = None
+            self._suffix_array = None
             self.suffix_link = suffix_link
 
     @classmethod
@@ -322,25 +463,55 @@ class SuffixTree(Tree):
         """
         return cls(string=None, **kwargs)
 
+    def _new_node(self, pathlabel_len):
+        """Create a new abstract node for this suffix tree. All nodes of the
+        tree are allocated here during the construction.
+
+        Args:
+            pathlabel_len (int): Length of the substring represented by the new
+                node.
+
+        Return:
+            the new node (tree).
+        """
+        # pylint: disable=protected-access
+        node = SuffixTree._as_node(pathlabel_len=pathlabel_len)
+        # Share the root data so that nodes never walk back to the root.
+        node._string = self._string
+        node._case_sensitive = self._case_sensitive
+        node._suffix_array = self._suffix_array
+        return node
+
     def _construct(self):
         """Use Ukkonen's algorithm for suffix tree construction in linear time.
         """
         # Set active state to the root node.
-        self._active = Substr(self)
+        self._active = active = Substr(self)
+        # The active state is updated in place during the whole construction;
+        # ...so it, its methods, and the string are bound to locals once.
+        extend_char = active.extend_char
+        extend_along_edge = active.extend_along_edge
+        string = self._string
+        strlen = len(string)
         # Loop on characters of the text from left to right.
-        for phase, char in enumerate(self._string):
-            extended_successfully = self._active.extend(char, forced=False)
-            if extended_successfully:
-                # It's already in the tree
+        phase = 0
+        while phase < strlen:
+            char = string[phase]
+            if extend_char(char, string):
+                # It's already in the tree. So are the next characters as long
+                # ...as they match the active edge; skip these phases at once.
+                phase += 1
+                phase += extend_along_edge(string, phase)
                 continue
 
-            if not self._active.ends_on_node():
+            if not active.ends_on_node():
                 # Since the active state is not a node, the underlying edge is
                 # ...going to be splitted before adding new suffix to the tree.
-                self._active = Substr(self._splitedge())
+                active.reset(self._splitedge())
                 # Now active state is a node.
 
             self._extend_prefix(char, phase)
+            phase += 1
 
     def _splitedge(self, substr=None):
         """Split an edge from the point indicated by the given substring which
@@ -354,6 +525,7 @@ class SuffixTree(Tree):
         Return:
             the new node (tree).
         """
+        # pylint: disable=protected-access
         if not substr:
             substr = self._active
 
@@ -362,20 +534,21 @@ class SuffixTree(Tree):
             return substr.subtree
 
         # Pick the edge should be splitted.
-        split_edge = substr.subtree.root_edges[substr.edge_char]
+        split_edge = substr.subtree._root_edges[substr.edge_char]
         # New node...
-        new_subtree = SuffixTree._as_node()
+        new_subtree = self._new_node(substr.subtree.pathlabel_len +
+                                     substr.depth)
         # Edge from the `substr.subtree` to the new node: (start, start + depth)
         new_edge = SuffixEdge(start=split_edge.start,
                               end=(split_edge.start + substr.depth),
                               dst=new_subtree)
         # Add the new edge and subtree to the suffix tree. Replacing the
         # ...splitted edge.
-        substr.subtree.root_edges[substr.edge_char] = new_edge
+        substr.subtree.add_edge(substr.edge_char, new_edge)
         # Edit splitted edge to be: (start + depth, end)
         split_edge.start = split_edge.start + substr.depth
         # Add the splitted edge and its subtree to the new node.
-        new_subtree.root_edges[self._string[split_edge.start]] = split_edge
+        new_subtree.add_edge(self._string[split_edge.start], split_edge)
 
         return new_subtree
 
@@ -391,66 +564,96 @@ class SuffixTree(Tree):
             phase (int): Current phase of construction defined in Ukkonen's
                 algorithm.
         """
-        # Active state should be a node.
-        assert self._active.ends_on_node()
-        # Suffix 'str(self._active) + char' should not be already in the tree.
-        assert char not in self._active.subtree.root_edges
-
-        # Create a new subtree.
-        new_subtree = SuffixTree._as_node()
-        # Create a new edge.
-        new_edge = SuffixEdge(start=phase, end=len(self._string),
-                              dst=new_subtree)
-        # Add the new subtree to the tree using the new edge.
-        self._active.subtree.root_edges[char] = new_edge
-
-        # is_root() == Root node (from Tree class) == No parent edge
-        # not-abstract == Root of the suffix tree
-        if self._active.subtree.is_root() or \
-           not self._active.subtree.abstract:
-            return
-        # else:
-        # Finding the next suffix node and setting the active state to that node
-        next_suffix = self._active.subtree.suffix_link
-        if next_suffix is not None:
-            # Follow the suffix link...
-            self._active = Substr(next_suffix)
-        else:
-            prev_suffix = self._active
-            # Find the next suffix node...
-            act_parent_edge = self._active.subtree.parent_edge
-            act_parent = act_parent_edge.src
-            i = act_parent_edge.start
-            j = act_parent_edge.end
-            if act_parent.is_root():
-                target_node = act_parent
-                i += 1
+        # pylint: disable=protected-access
+        # The active state is updated in place; bind it to a local once.
+        active = self._active
+        # All leaf edges end at the end of the string (sentinel included).
+        strlen = len(self._string)
+        # Add the suffixes one by one until either the next suffix is already
+        # ...in the tree or the root node is reached.
+        while True:
+            active_sub = active.subtree
+            # Active state should be a node.
+            assert active.ends_on_node()
+            # Suffix 'str(self._active) + char' should not be already in the
+            # ...tree.
+            assert char not in active_sub._root_edges
+
+            # Add a new subtree to the tree using a new edge.
+            active_sub.add_edge(char, SuffixEdge(
+                start=phase, end=strlen,
+                dst=self._new_node(active_sub.pathlabel_len + strlen - phase)))
+
+            # is_root() == Root node (from Tree class) == No parent edge
+            # not-abstract == Root of the suffix tree
+            if active_sub.is_root() or not active_sub.abstract:
+                return
+            # else:
+            # Finding the next suffix node and setting the active state to that
+            # ...node.
+            next_suffix = active_sub.suffix_link
+            if next_suffix is not None:
+                # Follow the suffix link...
+                active.reset(next_suffix)
             else:
-                target_node = act_parent.suffix_link
-            assert target_node is not None
-            while True:
-                c = self._string[i]
-                child_edge = target_node.root_edges[c]
-                if len(child_edge) > j - i:
-                    break
-                target_node = child_edge.dst
-                i += len(child_edge)
-            if j - i == 0:
-                c = None
-            self._active = Substr(target_node, edge_char=c, depth=j-i)
-            # Split the edge if required.
-            if not self._active.ends_on_node():
-                self._active = Substr(self._splitedge())
-            # Add suffix link.
-            prev_suffix.subtree.suffix_link = self._active.subtree
-
-        # Check if the new suffix is already in the tree, then extend the active
-        # ...state.
-        extended_successfully = self._active.extend(char, forced=False)
-        if not extended_successfully:
-            # If not, call the function recursively until either the new suffix
-            # ...is in the tree or reach the root node.
-            self._extend_prefix(char, phase)
+                # Find the next suffix node...
+                act_parent_edge = active_sub.parent_edge
+                act_parent = act_parent_edge.src
+                i = act_parent_edge.start
+                j = act_parent_edge.end
+                if act_parent.is_root():
+                    target_node = act_parent
+                    i += 1
+                else:
+                    target_node = act_parent.suffix_link
+                assert target_node is not None
+                while True:
+                    c = self._string[i]
+                    child_edge = target_node._root_edges[c]
+                    child_len = child_edge.end - child_edge.start
+                    if child_len > j - i:
+                        break
+                    target_node = child_edge.dst
+                    i += child_len
+                if j - i == 0:
+                    c = None
+                active.reset(target_node, edge_char=c, depth=j-i)
+                # Split the edge if required.
+                if not active.ends_on_node():
+                    active.reset(self._splitedge())
+                # Add suffix link.
+                active_sub.suffix_link = active.subtree
+
+            # Check if the new suffix is already in the tree, then extend the
+            # ...active state.
+            if active.extend_char(char, self._string):
+                return
+
+    def _index_suffixes(self):
+        """Collect start indices of all suffixes in DFS order into the suffix
+        array. Suffixes going through a node form a contiguous interval of this
+        array, so each node is stamped with its interval `[_sa_lo, _sa_hi)`.
+        """
+        # pylint: disable=protected-access
+        suffix_array = self._suffix_array
+        strlen = len(self._string)
+        # Each node is pushed twice: before and after visiting its subtree.
+        stack = [(self, False)]
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                node._sa_hi = len(suffix_array)
+                continue
+            node._sa_lo = len(suffix_array)
+            root_edges = node._root_edges
+            if not root_edges:  # A leaf node.
+                suffix_array.append(strlen - node._pathlabel_len)
+                node._sa_hi = node._sa_lo + 1
+                continue
+            stack.append((node, True))
+            # Loop on children "in order" as `dfs` does.
+            for edge_id in reversed(node.sorted_edge_ids):
+                stack.append((root_edges[edge_id].dst, False))
 
     def traverse(self, query):
         """Traverse the tree by the given query. The matched position in the
@@ -468,7 +671,7 @@ class SuffixTree(Tree):
         if not self.case_sensitive:
             query = query.lower()
 
-        matched_pos = Substr(self, query)
+        matched_pos = Substr.from_query(self, query)
         if not matched_pos:
             return None
         # else:
@@ -480,32 +683,33 @@ class SuffixTree(Tree):
         Args:
             query (string): query string.
 
-        Yield:
-            indices of occurrance of the query in the text.
+        Return:
+            indices of occurrance of the query in the text as an array; i.e. a
+            slice of the suffix array.
         """
         matched_pos = self.traverse(query)
 
         if matched_pos is None:
-            return
+            return self._suffix_array[:0]
         # else:
         matched_node = matched_pos.subtree
         if not matched_pos.ends_on_node():
             edge = matched_node.root_edges[matched_pos.edge_char]
             matched_node = edge.dst
 
-        for sufidx in matched_node.suffix_indices():
-            yield sufidx
+        return matched_node.suffix_indices()
 
     def suffix_indices(self):
         """Find indices of all suffixes in the text started with the common
         prefix denoted by this node (self.pathlabel).
 
-        Yield:
-            indices of all suffixes going through this node.
+        Return:
+            indices of all suffixes going through this node as an array; i.e.
+            the slice of the suffix array covering this subtree.
         """
-        for node in self.dfs():
-            if node.is_leaf():
-                yield len(self.string) - len(node.pathlabel)
+        if self._suffix_array is None:  # Not a node of a constructed tree.
+            return array('l')
+        return self._suffix_array[self._sa_lo:self._sa_hi]
 
     def visualize(self, **kwargs):
         """Override visualize function of the Tree (super class).
@@ -519,7 +723,7 @@ class SuffixTree(Tree):
 
         def visualize_suffix_links(dot, tree):
             """Add suffix links to the dot graph."""
-            for node in tree.dfs():
+            for node in tree.dfs_order():
                 sufnode = node.suffix_link
                 if sufnode:
                     dot.edge(str(node.root_id), str(sufnode.root_id),
@@ -534,15 +738,15 @@ class SuffixTree(Tree):
     @property
     def string(self):
         """Read-only property returns corresponding string."""
-        if not self.is_root():
-            return self.parent_edge.src.string
+        if self._string is None and not self.is_root():
+            self._string = self.parent_edge.src.string
         return self._string
 
     @property
     def case_sensitive(self):
         """Read-only property returns if the string is case sensitive or not."""
-        if not self.is_root():
-            return self.parent_edge.src.case_sensitive
+        if self._case_sensitive is None and not self.is_root():
+            self._case_sensitive = self.parent_edge.src.case_sensitive
         return self._case_sensitive
 
     @property
@@ -555,10 +759,14 @@ class SuffixTree(Tree):
         """Substring represented by the root of this subtree. It will be
         calculated when it's needed.
         """
-        if self._pathlabel is None:
-            self._pathlabel = self.get_pathlabel()
+        return self.get_pathlabel()
 
-        return self._pathlabel
+    @property
+    def pathlabel_len(self):
+        """Read-only property returns length of the substring represented by
+        the root of this subtree.
+        """
+        return self._pathlabel_len
 
     def get_pathlabel(self):
         """Return substring represented by the root of this subtree."""
@@ -567,13 +775,12 @@ class SuffixTree(Tree):
         if self.is_root() or not self._abstract:
             return ""
 
-        pathlabel = ""
-        parent_edge = self.parent_edge
-        while parent_edge is not None:
-            pathlabel = str(parent_edge) + pathlabel
-            parent_edge = parent_edge.src.parent_edge
-
-        return pathlabel
+        # The path label of a node is an occurrence in the text that ends where
+        # ...its parent edge ends: leaf edges are added right after the path to
+        # ...their parent and splitting an edge keeps this property for both
+        # ...parts. So it can be sliced at once without walking up the tree.
+        end = self.parent_edge.end
+        return self.string[end-self._pathlabel_len:end]
 
     def __str__(self):
         """Get original string without sentinel (for root nodes).
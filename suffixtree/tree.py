@@ -10,10 +10,71 @@
     :license: MIT, see LICENSE for more details.
 """
 
+import re
+from bisect import bisect
 from collections import deque
+from itertools import count
+from types import MappingProxyType
 from graphviz import Digraph
 
 
+# A double quote in a DOT string with its preceding backslashes (if any).
+_DOT_QUOTE = re.compile(r'(?P<backslashes>(?:\\{2})*)\\?"')
+
+
+def _dot_quote(string):
+    """Return the given string as a quoted DOT ID. Double quotes in the string
+    are escaped unless they are already escaped. HTML-like strings ("<...>")
+    are returned as they are.
+    """
+    if string.startswith('<') and string.endswith('>'):
+        return string
+    if '"' in string:
+        string = _DOT_QUOTE.sub(r'\g<backslashes>\\"', string)
+    return '"' + string + '"'
+
+
+def _dot_attr_list(attributes):
+    """Return the DOT attribute list of the given attributes (dict). It is
+    assembled as a string starting with a space, or empty if there is none.
+    Attributes whose values are None are left out.
+    """
+    return "".join(" " + str(key) + "=" + _dot_quote(str(value))
+                   for key, value in sorted(attributes.items())
+                   if value is not None)
+
+
+class _StreamedDigraph(Digraph):  # pylint: disable=too-many-ancestors
+    """Digraph whose statements can be streamed rather than being kept in its
+    body.
+
+    The statements generated by `statements` are yielded right before the ones
+    in the body when the source is iterated; so `source`, `pipe`, and `save`
+    (or `render`) all include them, while the graph never keeps them.
+    """
+
+    def statements(self):
+        """Generate DOT statements to be streamed (each ending with a newline).
+        There is none by default.
+        """
+        return ()
+
+    def __iter__(self, subgraph=False):
+        """Yield the DOT source line by line including the streamed statements.
+        See `Digraph.__iter__`.
+        """
+        # Lines of the graph itself: head, body, and tail.
+        lines = list(super().__iter__(subgraph=subgraph))
+        nof_head_lines = len(lines) - len(self.body) - 1
+        yield from lines[:nof_head_lines]
+        if lines[-1].endswith("\n"):
+            yield from self.statements()
+        else:  # Lines are not newline-terminated in older graphviz versions.
+            for statement in self.statements():
+                yield statement[:-1]
+        yield from lines[nof_head_lines:]
+
+
 class Edge:
     """Edge class.
 
@@ -21,6 +82,8 @@ class Edge:
     basic functionalities of an edge in the Tree which can be used as a base
     class for implementing any other edge class.
     """
+    __slots__ = ('dst', 'src', 'data')
+
     def __init__(self, dst, data=None, src=None):
         """Constructor for Edge class.
 
@@ -29,8 +92,7 @@ class Edge:
             data: Data associated with the edge.
             src (Tree): The subtree that this edge comes from (optional). It
                 will be set or overwritten automatically when it's associated
-                with a tree by `__setitem__` function of the `root_edge`
-                dictionary of the tree class.
+                with a tree by `add_edge` function of the tree class.
         """
         self.dst = dst
         self.src = src
@@ -49,10 +111,13 @@ class Edge:
 
         NOTE: This will be used as edge label in graph visualization.
         """
-        if self.data is None:
+        data = self.data
+        if data is None:
             return ""
+        if isinstance(data, str):  # The label itself; no conversion needed.
+            return data
 
-        return str(self.data)
+        return str(data)
 
     def __repr__(self):
         """Return string representation of the Edge class instance."""
@@ -64,14 +129,45 @@ class Edge:
                            str(self.dst.root_id))
 
 
-class Tree:
+class _TreeCounter:  # pylint: disable=too-few-public-methods
+    """Counter of instantiated trees.
+
+    Tree sequence numbers are handed out by `next` on an `itertools.count`. As
+    a class attribute, it reads as the number of trees instantiated so far
+    (i.e. the last handed out number plus one) on both the class and its
+    instances.
+    """
+    __slots__ = ('_count', '_last')
+
+    def __init__(self):
+        """Constructor for _TreeCounter class."""
+        self._count = count()
+        self._last = -1
+
+    def __next__(self):
+        """Return the next tree sequence number."""
+        self._last = next(self._count)
+        return self._last
+
+    def __get__(self, instance, owner=None):
+        """Return the number of trees instantiated so far."""
+        return self._last + 1
+
+
+# Sequence numbers of instantiated trees (see `Tree.nof_trees`).
+_TREE_NOS = _TreeCounter()
+
+
+class Tree:  # pylint: disable=too-many-instance-attributes
     """Tree class.
 
     This class implements a tree data structure recursively. Each tree has some
     trees as its children (subtrees). Obviously, leaf nodes are subtrees with no
     children. Edges to the subtrees of a tree are stored in a member variable
-    'root_edges' whose type is EdgeDict. It is dictionary-like data type whose
-    keys are edge IDs and values are edge data.
+    'root_edges' which is a (read-only) dictionary whose keys are edge IDs and
+    values are edges. Edges should be added by `add_edge` (or `add_subtree`) and
+    removed by `remove_edge` so that the tree structure integrity is guaranteed
+    through construction process.
 
     NOTE:
         Edge data type should have "dst" and "src" properties that refer to the
@@ -82,45 +178,13 @@ class Tree:
         The data type of `root_data` should implements `__str__` to return
         string representation of the root data.
     """
+    __slots__ = ('_root_id', 'root_data', '_root_edges', 'parent_edge',
+                 '_sorted_edge_ids', '_next_auto_edge_id', '_dfs_order',
+                 '_subtrees')
+
     # No. of trees instantiated so far. It's used as unique ID for each
     # instance.
-    nof_trees = 0
-
-    class EdgeDict(dict):
-        """EdgeDict class.
-
-        A data type storing edges of a node that can be accessed by their IDs
-        as the key. It acts exactly like a dictionary but it assures that all
-        required field of the edge data type; i.e. "dst" and "src", will be
-        properly set such that the tree structure integrity is gauranteed
-        through construction process.
-        """
-        def __init__(self, root):
-            """Constructor for the EdgeDict class.
-
-            Apart from calling `__init__` function of super class, it stores
-            the root node whose edges are going to be stored.
-
-            Args:
-                root (Tree): Root node whose edges are going to be stored.
-            """
-            super().__init__()
-            self.root = root
-
-        def __setitem__(self, key, value):
-            """Add an edge to the edge container.
-
-            It also defines the forward and backward connectivity in an edge by
-            setting 'src' property of edge to `self.root` and 'dst.parent_edge'
-            to the edge.
-
-            Args:
-                key: Edge ID of the edge.
-                value: New edge data.
-            """
-            super().__setitem__(key, value)
-            self[key].src = self.root
-            self[key].dst.parent_edge = value
+    nof_trees = _TREE_NOS
 
     def __init__(self, root_data=None, root_id=None):
         """Constructor for the Tree class.
@@ -130,17 +194,26 @@ class Tree:
             root_id: Assigns an ID to the root node of this tree. In case that
                 it's not provided, `nof_trees` value will be used.
         """
+        tree_no = next(_TREE_NOS)
         if root_id is None:
-            root_id = Tree.nof_trees
+            root_id = tree_no
         self._root_id = root_id
         self.root_data = root_data
 
         # Root node's edge container
-        self._root_edges = Tree.EdgeDict(self)
+        self._root_edges = {}
+        # Sorted IDs of the root node's edges. It's computed on demand.
+        self._sorted_edge_ids = None
+        # The next candidate for automatically assigned edge IDs.
+        self._next_auto_edge_id = 0
+        # Nodes of the tree in DFS order. It's computed on demand (see
+        # ...`dfs_order`).
+        self._dfs_order = None
+        # Subtrees of the root node. It's computed on demand.
+        self._subtrees = None
         # parent_edge: Reference to the incoming parent edge if there's any. It
         # ...allows to traverse back in the tree.
         self.parent_edge = None  # default value is None.
-        Tree.nof_trees += 1
 
     @property
     def root_id(self):
@@ -149,10 +222,82 @@ class Tree:
 
     @property
     def root_edges(self):
-        """Read-only variable `root_edges`. It can be modified by using common
-        dictionary `__getitem__` and `__setitem__` functions.
+        """Read-only variable `root_edges`. It is a read-only view of the edges
+        which can be accessed by using common dictionary functions. Edges should
+        be added by `add_edge` (or `add_subtree`) and removed by `remove_edge`.
+        """
+        return MappingProxyType(self._root_edges)
+
+    @property
+    def sorted_edge_ids(self):
+        """Read-only variable returning the sorted edge IDs as a tuple. It is
+        computed on the first access and then kept sorted by `add_edge` and
+        `remove_edge`.
+
+        NOTE: Nodes with no edges (e.g. leaves) get a shared empty tuple, which
+        is not stored; so they carry no tuple of their own.
+        """
+        if self._sorted_edge_ids is None:
+            if not self._root_edges:
+                return ()
+            self._sorted_edge_ids = tuple(sorted(self._root_edges))
+        return self._sorted_edge_ids
+
+    def add_edge(self, edge_id, edge):
+        """Add an edge to the root node's edges. An existing edge with the same
+        ID will be replaced.
+
+        It also defines the forward and backward connectivity in the edge by
+        setting 'src' property of the edge to this tree and 'dst.parent_edge'
+        to the edge.
+
+        Args:
+            edge_id (object): id of the edge (key for `root_edge` dict).
+            edge (Edge): the edge.
+
+        Return:
+            the edge.
+        """
+        if self._dfs_order is not None:
+            self._drop_dfs_orders()  # They are not valid anymore.
+
+        edge.src = self
+        edge.dst.parent_edge = edge
+        edge_ids = self._sorted_edge_ids
+        if edge_ids is not None and edge_id not in self._root_edges:
+            # Insert the new ID in order rather than sorting all IDs again.
+            i = bisect(edge_ids, edge_id)
+            self._sorted_edge_ids = edge_ids[:i] + (edge_id,) + edge_ids[i:]
+        self._root_edges[edge_id] = edge
+        self._subtrees = None  # The old value is not valid anymore.
+
+        return edge
+
+    def remove_edge(self, edge_id):
+        """Remove an edge from the root node's edges.
+
+        The removed edge is detached from its `dst` subtree by resetting
+        'dst.parent_edge'.
+
+        Args:
+            edge_id (object): id of the edge (key for `root_edge` dict).
+
+        Return:
+            the removed edge.
         """
-        return self._root_edges
+        if self._dfs_order is not None:
+            self._drop_dfs_orders()  # They are not valid anymore.
+
+        edge = self._root_edges.pop(edge_id)
+        edge_ids = self._sorted_edge_ids
+        if edge_ids is not None:
+            i = edge_ids.index(edge_id)
+            self._sorted_edge_ids = edge_ids[:i] + edge_ids[i+1:]
+        self._subtrees = None  # The old value is not valid anymore.
+        if edge.dst.parent_edge is edge:
+            edge.dst.parent_edge = None
+
+        return edge
 
     def add_subtree(self, stree, edge_id=None, edge_data=None):
         """Add a tree to its subtrees.
@@ -167,24 +312,36 @@ class Tree:
             the connecting edge.
         """
         if edge_id is None:
-            edge_id = len(self.root_edges.keys())
-            while edge_id in self.root_edges:
+            edge_id = self._next_auto_edge_id
+            # Skip IDs already given explicitly.
+            while edge_id in self._root_edges:
                 edge_id += 1
+            self._next_auto_edge_id = edge_id + 1
 
-        edge = Edge(dst=stree, data=edge_data)
-        self.root_edges[edge_id] = edge
-
-        return edge
+        return self.add_edge(edge_id, Edge(dst=stree, data=edge_data))
 
     @property
     def subtrees(self):
+        """Read-only variable returning the subtrees as a tuple. It is computed
+        on the first access and kept until an edge is added or removed.
+
+        NOTE: Leaves get a shared empty tuple, which is not stored.
+        """
+        if self._subtrees is None:
+            if not self._root_edges:
+                return ()
+            self._subtrees = tuple(e.dst for e in self._root_edges.values())
+        return self._subtrees
+
+    @property
+    def subtrees_iter(self):
         """Subtrees generator."""
-        for edge in self.root_edges.values():
+        for edge in self._root_edges.values():
             yield edge.dst
 
     def get_subtree(self, edge_id):
         """Get a subtree by edge ID."""
-        return self.root_edges[edge_id].dst
+        return self._root_edges[edge_id].dst
 
     def is_root(self):
         """Whether this subtree is root or not."""
@@ -192,7 +349,7 @@ class Tree:
 
     def is_leaf(self):
         """Whether this subtree is a child or not."""
-        return not bool(self.root_edges)
+        return not bool(self._root_edges)
 
     def visualize(self, name, comment, pro_do=lambda dot, tree: None, **kwargs):
         """Visualize the graph by using graphviz package and dot language.
@@ -204,7 +361,8 @@ class Tree:
                 before rendering. It gets 'dot' and 'tree' objects as an
                 argument and it is useful for the inherited subclasses to
                 override this method by adding more things to the final rendered
-                graph.
+                graph. Nodes and edges of the tree are streamed to the source
+                file on rendering; so they are not in `dot.body`.
 
         kwargs:
             filename (str): Name of the output file (default='tree').
@@ -234,10 +392,16 @@ class Tree:
 
                 See the full list at:
                     http://graphviz.readthedocs.io/en/latest/api.html#graphviz.Digraph.render
+
+        NOTE: The nodes are visited in `dfs_order`, which is computed by `dfs`
+        and then cached for later traversals. Leaves are determined by
+        `is_leaf`.
         """
         filename = kwargs.pop('filename', 'tree')
         fmt = kwargs.pop('fmt', 'svg')
-        hl_nodes = kwargs.pop('hl_nodes', [])
+        # Highlighted nodes are looked up by their IDs in constant time. Nodes
+        # ...are identified by their IDs in the dot graph as well.
+        hl_ids = {n.root_id for n in kwargs.pop('hl_nodes', [])}
 
         graph_attr = {
             'graph_attr': {'ratio': '1'},
@@ -260,22 +424,17 @@ class Tree:
         hl_nodes_attr = kwargs.pop('hl_nodes_attr', hl_nodes_attr)
 
         # Create a dot graph by given name, comment, and attributes.
-        dot = Digraph(name, comment, **graph_attr)
+        dot = _StreamedDigraph(name, comment, **graph_attr)
 
-        # Traverse the tree by DFS.
-        for node in self.dfs():
-            attributes = {}
-            if node.is_leaf():
-                attributes = leaves_attr
-            if node in hl_nodes:
-                attributes = hl_nodes_attr  # Overriding leave attributes.
+        # Attribute lists are assembled once rather than for each node.
+        leaves_attr = _dot_attr_list(leaves_attr)
+        hl_nodes_attr = _dot_attr_list(hl_nodes_attr)
 
-            # Add the node to dot graph.
-            dot.node(str(node.root_id), str(node), **attributes)
-            if node != self:  # If node is not the caller, add its parent edge.
-                # Add parent edge to the dot graph.
-                dot.edge(str(node.parent_edge.src.root_id), str(node.root_id),
-                         label=str(node.parent_edge))
+        # DOT statements of the tree are generated whenever the source is
+        # ...iterated rather than being kept in the graph body; see
+        # ...`_StreamedDigraph`.
+        dot.statements = lambda: self._dot_statements(hl_ids, leaves_attr,
+                                                      hl_nodes_attr)
 
         # Do more by subclasses' overrided visualize function!
         pro_do(dot, self)
@@ -284,21 +443,89 @@ class Tree:
         # Rendering... . Remaining kwargs will be passed to the render function.
         dot.render(filename, **kwargs)
 
+    def _dot_statements(self, hl_ids, leaves_attr, hl_nodes_attr):
+        """Generate DOT statements of the nodes and edges of the tree (see
+        `visualize`). Each statement ends with a newline.
+
+        Args:
+            hl_ids (set): IDs of the highlighted nodes.
+            leaves_attr (str): DOT attribute list of the leaves.
+            hl_nodes_attr (str): DOT attribute list of the highlighted nodes.
+        """
+        # Quoted node IDs by `root_id`. Parents are visited before their
+        # ...children in DFS; so a parent's ID is quoted once for all children.
+        node_ids = {}
+        # Traverse the tree by DFS. The order is cached (see `dfs_order`), so
+        # ...later traversals, e.g. by subclasses in `pro_do`, reuse it.
+        for node in self.dfs_order():
+            attributes = ""
+            if node.is_leaf():
+                attributes = leaves_attr
+            if node.root_id in hl_ids:
+                attributes = hl_nodes_attr  # Overriding leave attributes.
+
+            # Add the node to dot graph.
+            node_id = _dot_quote(str(node.root_id))
+            node_ids[node.root_id] = node_id
+            yield ("\t" + node_id + " [label=" + _dot_quote(str(node)) +
+                   attributes + "]\n")
+            if node is not self:  # If node is not the caller, add parent edge.
+                parent_edge = node.parent_edge
+                yield ("\t" + node_ids[parent_edge.src.root_id] + " -> " +
+                       node_id + " [label=" + _dot_quote(str(parent_edge)) +
+                       "]\n")
+
     def dfs(self):
         """Traverse the tree by DFS algorithm and yields visiting nodes
         (corresponding subtrees). Children of a node are traversed in order
         based on edge ID ordering; i.e. smaller ID (depends on ordering of edge
         IDs) will be visited first.
         """
+        # pylint: disable=unsubscriptable-object,not-an-iterable
+        order = self._dfs_order
+        if order is not None and order[0] is self:  # See `dfs_order`.
+            yield from order
+            return
+
         # Add root node (subtree) to the stack.
         stack = [self]
         while stack:
             node = stack.pop()
-            # Loop on children "in order"...
-            for edge_id in sorted(node.root_edges.keys(), reverse=True):
-                # ...and add them to the stack.
-                stack.append(node.get_subtree(edge_id))
             yield node
+            # Add children to the stack in reverse order so that they are
+            # ...popped "in order".
+            root_edges = node._root_edges
+            stack.extend(root_edges[edge_id].dst
+                         for edge_id in reversed(node.sorted_edge_ids))
+
+    def dfs_order(self):
+        """Return the nodes (corresponding subtrees) in the order they are
+        visited by `dfs` as a tuple. It is computed once and kept until the tree
+        is modified by `add_edge` (or `add_subtree`) or `remove_edge`.
+
+        NOTE: All nodes of the tree refer to the computed tuple as well; it
+        marks them as parts of a tree with a cached order. The tuple is their
+        own order only if it starts with them. So the cached orders of a node
+        and all its ancestors can be dropped by walking up the tree until a
+        node with no cached order is reached (see `_drop_dfs_orders`).
+        """
+        # pylint: disable=protected-access,unsubscriptable-object
+        order = self._dfs_order
+        if order is None or order[0] is not self:
+            order = tuple(self.dfs())
+            for node in order:
+                node._dfs_order = order
+
+        return order
+
+    def _drop_dfs_orders(self):
+        """Drop the cached DFS orders of this tree and all its ancestors."""
+        # pylint: disable=protected-access
+        node = self
+        while node is not None and node._dfs_order is not None:
+            node._dfs_order = None
+            parent_edge = node.parent_edge
+            node = None if parent_edge is None else parent_edge.src
 
     def bfs(self):
         """Traverse the tree by BFS algorithm and yields visiting nodes
@@ -310,11 +537,11 @@ class Tree:
         queue = deque([self])
         while queue:
             node = queue.popleft()
-            # Loop on children "in order"...
-            for edge_id in sorted(node.root_edges.keys()):
-                # ...and add them to the queue.
-                queue.append(node.get_subtree(edge_id))
             yield node
+            # Add children to the queue "in order".
+            root_edges = node._root_edges
+            queue.extend(root_edges[edge_id].dst
+                         for edge_id in node.sorted_edge_ids)
 
     def __str__(self):
         """Calling str() on a node (tree) gives you the label of the node (root
@@ -331,4 +558,4 @@ class Tree:
         if self.parent_edge is not None:
             parent_id = self.parent_edge.src.root_id
         return ptrn.format(str(self.root_id), repr(self.root_data),
-                           sorted(self.root_edges.keys()), str(parent_id))
+                           list(self.sorted_edge_ids), str(parent_id))
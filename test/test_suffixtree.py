@@ -81,5 +81,53 @@ def test_main():
     suftree.visualize(filename="suffix_tree_seq", directory=FIGDIR,
                       no_suffixlink=True, view=VIEW, cleanup=True)
 
+
+def test_substr():
+    """Test Substr class"""
+    suftree = st.SuffixTree("mississippi", case_sensitive=True)
+    for query in ["", "m", "mi", "ssi", "iss", "issip", "ppi"]:
+        substr = suftree.traverse(query)
+        assert substr
+        assert str(substr) == query
+    assert suftree.traverse("ssp") is None
+
+
+def test_suffix_edge():
+    """Test SuffixEdge class"""
+    suftree = st.SuffixTree("banana", case_sensitive=True)
+    edge = suftree.root_edges['b']
+    # Edge labels are kept as indices into the text, not as strings.
+    assert edge.data == (0, 7)
+    assert (edge.start, edge.end) == (0, 7)
+    assert str(edge) == "banana$"
+    assert len(edge) == 7
+    assert edge.edge_char == 'b'
+    edge = suftree.traverse("ana").subtree.parent_edge
+    assert str(edge) == suftree.string[edge.start:edge.end]
+
+
+def test_unicode():
+    """Test SuffixTree on a text with characters beyond the byte range"""
+    suftree = st.SuffixTree("日本語の本と日本")
+    indices = list(suftree.find("日本"))
+    assert len(indices) == 2
+    assert 0 in indices
+    assert 6 in indices
+    indices = list(suftree.find("本"))
+    assert len(indices) == 3
+    assert str(suftree.traverse("語の本")) == "語の本"
+    assert suftree.traverse("本本") is None
+
+
+def test_unindexed_node():
+    """Test suffix indices of a node which is not indexed"""
+    node = st.SuffixTree._as_node()  # pylint: disable=protected-access
+    assert len(node.suffix_indices()) == 0
+
+
 if __name__ == "__main__":
     test_main()
+    test_substr()
+    test_suffix_edge()
+    test_unicode()
+    test_unindexed_node()
@@ -10,6 +10,7 @@
     :license: MIT, see LICENSE for more details.
 """
 
+from abc import ABC
 from os import path
 import random
 import string
@@ -49,6 +50,7 @@ def test_main():
     assert tree1.root_data is None
     assert tree1.parent_edge is None
     assert st.Tree.nof_trees > 0
+    assert tree1.nof_trees == st.Tree.nof_trees
     assert tree1.is_root()
     assert tree1.is_leaf()
 
@@ -76,7 +78,7 @@ def test_main():
                        for _ in range(strlen))
     tree3 = st.Tree(root_data=rnddata2, root_id=rndid2)
     edge2 = st.Edge(dst=tree3, data="another edge")
-    tree1.root_edges['2'] = edge2
+    tree1.add_edge('2', edge2)
     assert tree3.parent_edge == edge2
     assert tree3.is_leaf()
     assert not tree3.is_root()
@@ -84,6 +86,7 @@ def test_main():
     assert tree1.get_subtree('2') == tree3
 
     assert tree2 in list(tree1.subtrees) and tree3 in list(tree1.subtrees)
+    assert tuple(tree1.subtrees_iter) == tree1.subtrees
 
     strlen = 6
     rndid3 = ''.join(random.choice(string.ascii_uppercase + string.digits)
@@ -136,6 +139,49 @@ def test_main():
     assert repr(tree4) == "<Tree ID:" + rndid3 + ", root_data:'" + rnddata3 + \
         "', root_edges:[], parent_ID:" + rndid1 + ">"
 
+    assert tree1.dfs_order() == (tree1, tree2, tree4, tree3)
+    tree5 = st.Tree()
+    tree4.add_subtree(tree5)
+    assert tree1.dfs_order() == (tree1, tree2, tree4, tree5, tree3)
+
+
+def test_dot_source():
+    """Test the DOT source of a visualised tree."""
+    tree = st.Tree(root_data='root', root_id='r')
+    tree.add_subtree(st.Tree(root_data='leaf', root_id='l'), 'x', 'edge')
+    sources = []
+
+    def do_more(dot, _):
+        """Add a statement after the ones of the tree and keep the source."""
+        dot.edge('l', 'r', label='back')
+        sources.append(dot.source)
+
+    tree.visualize('Source', 'DOT source', pro_do=do_more, filename='source',
+                   directory=path.join(CWDIR, 'figures', 'trees'), view=VIEW,
+                   cleanup=True)
+    lines = [line.strip() for line in sources[0].splitlines() if line.strip()]
+    assert lines[:2] == ['// DOT source', 'digraph Source {']
+    assert lines[-5:] == [
+        '"r" [label="root"]',
+        '"l" [label="leaf" fillcolor="lightgray" style="filled"]',
+        '"r" -> "l" [label="edge"]',
+        'l -> r [label=back]',
+        '}']
+
+
+def test_dot_html_label():
+    """Test HTML-like labels and attributes set to None in the DOT source."""
+    tree = st.Tree(root_data='<<b>x</b>>', root_id='r')
+    sources = []
+    tree.visualize('HTML', 'HTML-like label',
+                   pro_do=lambda dot, _: sources.append(dot.source),
+                   filename='html',
+                   leaves_attr={'style': 'filled', 'fillcolor': None},
+                   directory=path.join(CWDIR, 'figures', 'trees'), view=VIEW,
+                   cleanup=True)
+    lines = [line.strip() for line in sources[0].splitlines() if line.strip()]
+    assert '"r" [label=<<b>x</b>> style="filled"]' in lines
+
 
 @raises(AttributeError)
 def test_readonly_attr1():
@@ -151,8 +197,62 @@ def test_readonly_attr2():
     tree.root_id = 'new_id'
 
 
+@raises(AttributeError)
+def test_slots():
+    """Test tree and edge instances have no per-instance dict."""
+    tree = st.Tree()
+    edge = tree.add_subtree(st.Tree())
+    assert not hasattr(tree, '__dict__') and not hasattr(edge, '__dict__')
+    tree.new_attr = None  # pylint: disable=assigning-non-slot
+
+
+def test_remove_edge():
+    """Test removing edges of a tree."""
+    tree = st.Tree()
+    leaf1 = st.Tree()
+    leaf2 = st.Tree()
+    edge = tree.add_subtree(leaf1, 'a')
+    tree.add_subtree(leaf2, 'b')
+    assert tree.dfs_order() == (tree, leaf1, leaf2)
+    st.Tree().add_subtree(st.Tree())  # Changing another tree.
+    assert tree.dfs_order() is tree.dfs_order()
+    assert tree.subtrees == (leaf1, leaf2)
+    assert tree.sorted_edge_ids == ('a', 'b')
+    assert tree.remove_edge('a') is edge
+    assert tree.subtrees == (leaf2,)
+    assert tree.sorted_edge_ids == ('b',)
+    assert leaf1.is_root()
+    assert list(tree.dfs()) == [tree, leaf2]
+    assert list(tree.root_edges) == ['b']
+    assert repr(tree).endswith("root_edges:['b'], parent_ID:None>")
+
+
+@raises(TypeError)
+def test_readonly_edges():
+    """Test tree edges cannot be modified through `root_edges`."""
+    tree = st.Tree()
+    tree.add_subtree(st.Tree(), 'a')
+    del tree.root_edges['a']
+
+
+def test_subclass():
+    """Test subclassing tree along with other bases."""
+    class ABCTree(st.Tree, ABC):  # pylint: disable=too-few-public-methods
+        """A tree which is an abstract base class too."""
+        __slots__ = ()
+
+    tree = ABCTree()
+    assert tree.nof_trees == st.Tree.nof_trees > tree.root_id
+
+
 if __name__ == "__main__":
     test_edge()
     test_main()
+    test_dot_source()
+    test_dot_html_label()
     test_readonly_attr1()
     test_readonly_attr2()
+    test_slots()
+    test_remove_edge()
+    test_readonly_edges()
+    test_subclass()